@@ -1,6 +1,7 @@
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.engine import make_url
 from alembic import context
 
 import sys
@@ -9,7 +10,7 @@ backend_dir = str(Path(__file__).resolve().parents[1])
 sys.path.insert(0, backend_dir)
 
 from src.db.base import Base
-from src.core.config import settings
+from src.core.config import get_settings
 
 
 # this is the Alembic Config object, which provides
@@ -28,6 +29,19 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+# Indexes that only exist on PostgreSQL (see src/db/base.py)
+POSTGRESQL_ONLY_INDEXES = {"ix_trademarks_name_trgm"}
+
+
+def make_include_object(dialect_name: str):
+    """Skip PostgreSQL-only indexes when comparing other databases' schemas."""
+    def include_object(object, name, type_, reflected, compare_to):
+        if type_ == "index" and name in POSTGRESQL_ONLY_INDEXES:
+            return dialect_name == "postgresql"
+        return True
+    return include_object
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -46,10 +60,11 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = settings.DATABASE_URL
+    url = get_settings().DATABASE_URL
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=make_include_object(make_url(url).get_dialect().name),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -69,7 +84,7 @@ def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section, {})
 
     # Sobreescribir la URL de la base de datos con la de nuestro settings
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL
+    configuration["sqlalchemy.url"] = get_settings().DATABASE_URL
 
     connectable = engine_from_config(
         configuration,
@@ -79,7 +94,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=make_include_object(connection.dialect.name),
         )
 
         with context.begin_transaction():
@@ -0,0 +1,43 @@
+"""Add status and name search indexes
+
+Revision ID: 5b8d2f4e6a13
+Revises: a3c1e5d7f902
+Create Date: 2025-09-02 10:41:07.284519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d2f4e6a13'
+down_revision: Union[str, Sequence[str], None] = 'a3c1e5d7f902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_trademarks_status'), 'trademarks', ['status'], unique=False)
+
+    # Trigram index so PostgreSQL can serve ILIKE '%term%' name searches
+    # without scanning the whole table
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_trademarks_name_trgm',
+            'trademarks',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_trademarks_name_trgm', table_name='trademarks')
+    op.drop_index(op.f('ix_trademarks_status'), table_name='trademarks')
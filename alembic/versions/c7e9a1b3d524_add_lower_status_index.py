@@ -0,0 +1,28 @@
+"""Add lower(status) index
+
+Revision ID: c7e9a1b3d524
+Revises: 5b8d2f4e6a13
+Create Date: 2025-09-02 16:05:52.903146
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e9a1b3d524'
+down_revision: Union[str, Sequence[str], None] = '5b8d2f4e6a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_trademarks_status_lower', 'trademarks', [sa.text('lower(status)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_trademarks_status_lower', table_name='trademarks')
@@ -0,0 +1,33 @@
+"""Add lower(name) index
+
+Revision ID: e2f4b6c8d035
+Revises: c7e9a1b3d524
+Create Date: 2025-09-03 09:27:14.661830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f4b6c8d035'
+down_revision: Union[str, Sequence[str], None] = 'c7e9a1b3d524'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL only uses a btree index for LIKE 'prefix%' when it is built
+    # with the pattern operator class (unless the database uses the C locale)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE INDEX ix_trademarks_name_lower ON trademarks (lower(name) text_pattern_ops)')
+    else:
+        op.create_index('ix_trademarks_name_lower', 'trademarks', [sa.text('lower(name)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_trademarks_name_lower', table_name='trademarks')
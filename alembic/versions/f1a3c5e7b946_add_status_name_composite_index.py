@@ -0,0 +1,37 @@
+"""Add (lower(status), name) composite index
+
+Revision ID: f1a3c5e7b946
+Revises: e2f4b6c8d035
+Create Date: 2025-09-04 11:52:33.170428
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a3c5e7b946'
+down_revision: Union[str, Sequence[str], None] = 'e2f4b6c8d035'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The composite index also serves lookups on lower(status) alone,
+    # so it replaces the single-expression index
+    op.create_index(
+        'ix_trademarks_status_name',
+        'trademarks',
+        [sa.text('lower(status)'), 'name'],
+        unique=False,
+    )
+    op.drop_index('ix_trademarks_status_lower', table_name='trademarks')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_trademarks_status_lower', 'trademarks', [sa.text('lower(status)')], unique=False)
+    op.drop_index('ix_trademarks_status_name', table_name='trademarks')
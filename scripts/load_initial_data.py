@@ -4,9 +4,13 @@ Run from backend directory: python scripts/load_initial_data_improved.py
 """
 
 import sys
+import json
+import asyncio
+import logging
 import argparse
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterable, Iterator
 
 # Configure Python path for imports
 current_dir = Path(__file__).resolve().parent
@@ -14,15 +18,19 @@ backend_dir = current_dir.parent
 sys.path.insert(0, str(backend_dir))
 
 # Project imports
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from src.db.session import SessionLocal, engine
-from src.db.base import Base, Trademark
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, text
+from src.db.session import get_engine, get_sessionmaker
+from src.db.base import TRADEMARK_STATUSES, Base, Trademark
 from src.crud import crud_trademark
-from src.api.v1.schemas.trademarks import TrademarkCreate
 
 # Import settings after configuring the path
-from src.core.config import settings
+from src.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Number of records written per INSERT statement
+BATCH_SIZE = 1000
 
 # Sample data to load
 SAMPLE_TRADEMARKS = [
@@ -123,209 +131,254 @@ ADDITIONAL_TEST_DATA = [
 ]
 
 
+def to_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map an input record to a trademarks row without Pydantic validation.
+
+    Only checks what the database needs: a name, with the same keys on every
+    row so a chunk can be sent as one multi-row INSERT.
+    """
+    if not item.get("name"):
+        raise ValueError(f"Record without a name: {item}")
+    return {
+        "name": item["name"],
+        "description": item.get("description"),
+        "status": item.get("status") or "Active",
+    }
+
+
 class BulkDataLoader:
     """Class to handle bulk data loading operations."""
 
-    def __init__(self, verbose: bool = False):
-        self.verbose = verbose
-        self.db: Session = SessionLocal()
-        self.validate_connection()
+    def __init__(self):
+        SessionLocal = get_sessionmaker()
+        self.db: AsyncSession = SessionLocal()
 
-    def __enter__(self):
+    async def __aenter__(self):
+        await self.validate_connection()
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.db.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.db.close()
 
-    def validate_connection(self):
+    async def validate_connection(self):
         """Validate database connection and show environment info"""
         try:
-            print(f"🔧 Environment: {settings.ENVIRONMENT}")
-            print(f"🔧 Database type: {'PostgreSQL' if settings.is_postgres else 'SQLite'}")
+            settings = get_settings()
+            logger.info(f"🔧 Environment: {settings.ENVIRONMENT}")
+            logger.info(f"🔧 Database type: {'PostgreSQL' if settings.is_postgres else 'SQLite'}")
 
             is_production = settings.ENVIRONMENT == "production"
-            print(f"🔧 Production deployment: {is_production}")
+            logger.info(f"🔧 Production deployment: {is_production}")
 
-            if self.verbose:
-                print(f"🔧 Database URL: {settings.DATABASE_URL}")
+            logger.debug(f"🔧 Database URL: {settings.DATABASE_URL}")
 
             # Test connection
             if settings.is_sqlite:
-                self.db.execute(text("SELECT 1"))
+                await self.db.execute(text("SELECT 1"))
             else:
-                self.db.execute(text("SELECT 1"))  # A simple SELECT 1 works for both
+                await self.db.execute(text("SELECT 1"))  # A simple SELECT 1 works for both
 
-            print("✅ Database connection successful")
+            logger.info("✅ Database connection successful")
 
         except Exception as e:
-            print(f"❌ Database connection failed: {e}")
+            logger.error(f"❌ Database connection failed: {e}")
             raise
 
-    def ensure_tables_exist(self):
-        """Ensure all tables exist"""
+    async def ensure_tables_exist(self, force: bool = False):
+        """Ensure all tables exist (in development, or when forced)"""
+        # Deployed databases get their schema from the Alembic migrations
+        if not force and get_settings().ENVIRONMENT != "development":
+            logger.info("ℹ️ Skipping table creation (use --create-tables to force it)")
+            return
+
         try:
-            print("🏗️ Creating tables if they don't exist...")
-            Base.metadata.create_all(bind=engine)
-            print("✅ Tables are ready")
+            logger.info("🏗️ Creating tables if they don't exist...")
+            async with get_engine().begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            logger.info("✅ Tables are ready")
         except Exception as e:
-            print(f"❌ Error creating tables: {e}")
+            logger.error(f"❌ Error creating tables: {e}")
             raise
 
-    def clear_existing_data(self):
+    async def clear_existing_data(self):
         """Clear existing data (optional)."""
         try:
-            print("🗑️ Clearing existing data...")
-            count = self.db.query(Trademark).count()
-            if count > 0:
-                self.db.query(Trademark).delete()
-                self.db.commit()
-                print(f"✅ Cleared {count} existing records")
+            logger.info("🗑️ Clearing existing data...")
+            if get_settings().is_postgres:
+                # TRUNCATE empties the table at once and restarts the id sequence
+                await self.db.execute(text("TRUNCATE TABLE trademarks RESTART IDENTITY"))
+                await self.db.commit()
+                logger.info("✅ Cleared existing records")
+                return
+
+            # Bulk DELETE without synchronizing objects held by the session
+            result = await self.db.execute(
+                delete(Trademark).execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            if result.rowcount > 0:
+                logger.info(f"✅ Cleared {result.rowcount} existing records")
             else:
-                print("ℹ️ No existing data to clear")
+                logger.info("ℹ️ No existing data to clear")
         except Exception as e:
-            print(f"❌ Error clearing data: {e}")
-            self.db.rollback()
+            logger.error(f"❌ Error clearing data: {e}")
+            await self.db.rollback()
             raise
 
-    def load_from_list(self, data: List[Dict[str, Any]], skip_existing: bool = True) -> int:
-        """Load data from a list of dictionaries."""
-        print(f"📥 Loading {len(data)} records from list...")
+    async def load_from_list(self, data: Iterable[Dict[str, Any]], skip_existing: bool = True) -> int:
+        """Load data from an iterable of dictionaries (a list or a lazy stream)."""
+        logger.info("📥 Loading records...")
+        total_count = 0
         loaded_count = 0
-        skipped_count = 0
         error_count = 0
 
-        for item in data:
-            try:
-                # Check if trademark already exists
-                existing = self.db.query(Trademark).filter(
-                    Trademark.name == item['name']
-                ).first()
-
-                if existing and skip_existing:
-                    skipped_count += 1
-                    if self.verbose:
-                        print(f"  ⚠️ Skipped (already exists): {item['name']}")
-                    continue
-                elif existing and not skip_existing:
-                    # Update existing record
-                    for key, value in item.items():
-                        setattr(existing, key, value)
-                    self.db.commit()
-                    loaded_count += 1
-                    if self.verbose:
-                        print(f"  🔄 Updated: {item['name']}")
-                    continue
-
-                # Create new trademark
-                trademark_data = TrademarkCreate(**item)
-                crud_trademark.create_trademark(db=self.db, trademark=trademark_data)
-                loaded_count += 1
-                if self.verbose:
-                    print(f"  ✅ Loaded: {item['name']}")
+        # Upsert the records in chunks, one INSERT ... ON CONFLICT statement
+        # and one transaction each, so only one chunk is held in memory
+        records = iter(data)
+        while chunk := list(islice(records, BATCH_SIZE)):
+            start = total_count
+            total_count += len(chunk)
+
+            # Validate each record on its own, so one bad record doesn't
+            # break the entire chunk
+            rows = []
+            for position, item in enumerate(chunk, start=start + 1):
+                try:
+                    rows.append(to_row(item))
+                except Exception as e:
+                    error_count += 1
+                    logger.error(f"  ❌ Error in record {position}: {e}")
+
+            if not rows:
+                continue
 
+            try:
+                loaded = await crud_trademark.bulk_upsert(self.db, rows, update_existing=not skip_existing)
+                loaded_count += loaded
+                logger.debug(f"  ✅ Loaded {loaded} of {len(chunk)} records")
             except Exception as e:
-                error_count += 1
-                print(f"  ❌ Error loading {item.get('name', 'Unknown')}: {e}")
-                # Don't break the entire process for one error
-                continue
+                await self.db.rollback()
+                error_count += len(rows)
+                logger.error(f"  ❌ Error loading records {start + 1}-{total_count}: {e}")
 
-        print(f"📊 Summary: {loaded_count} loaded, {skipped_count} skipped, {error_count} errors")
+        skipped_count = total_count - loaded_count - error_count
+        logger.info(f"📊 Summary: {loaded_count} loaded, {skipped_count} skipped, {error_count} errors")
         return loaded_count
 
-    def get_current_stats(self):
+    async def get_current_stats(self):
         """Get current database statistics."""
         try:
-            total = self.db.query(Trademark).count()
-            active = self.db.query(Trademark).filter(Trademark.status == "Active").count()
-            inactive = self.db.query(Trademark).filter(Trademark.status == "Inactive").count()
-            pending = self.db.query(Trademark).filter(Trademark.status == "Pending").count()
-            expired = self.db.query(Trademark).filter(Trademark.status == "Expired").count()
-
-            print("\n📊 CURRENT STATISTICS:")
-            print(f"  Total trademarks: {total}")
-            print(f"  Active: {active}")
-            print(f"  Inactive: {inactive}")
-            print(f"  Pending: {pending}")
-            print(f"  Expired: {expired}")
+            histogram = await crud_trademark.get_status_histogram(self.db)
+
+            logger.info("\n📊 CURRENT STATISTICS:")
+            logger.info(f"  Total trademarks: {sum(histogram.values())}")
+            for status in TRADEMARK_STATUSES:
+                logger.info(f"  {status}: {histogram.get(status, 0)}")
 
         except Exception as e:
-            print(f"❌ Error getting statistics: {e}")
+            logger.error(f"❌ Error getting statistics: {e}")
 
-    def show_sample_data(self, limit: int = 5):
+    async def show_sample_data(self, limit: int = 5):
         """Show sample data from the database"""
         try:
-            print(f"\n📋 SAMPLE DATA (first {limit} records):")
-            trademarks = self.db.query(Trademark).limit(limit).all()
+            logger.info(f"\n📋 SAMPLE DATA (first {limit} records):")
+            found = False
 
-            if not trademarks:
-                print("  No data found")
-                return
-
-            for tm in trademarks:
+            async for tm in crud_trademark.iter_trademarks(self.db, limit=limit):
+                found = True
                 desc = tm.description[:50] + "..." if tm.description and len(tm.description) > 50 else tm.description
-                print(f"  ID: {tm.id:2d} | {tm.name:15s} | {tm.status:10s} | {desc or 'No description'}")
+                logger.info(f"  ID: {tm.id:2d} | {tm.name:15s} | {tm.status:10s} | {desc or 'No description'}")
+
+            if not found:
+                logger.info("  No data found")
 
         except Exception as e:
-            print(f"❌ Error showing sample data: {e}")
+            logger.error(f"❌ Error showing sample data: {e}")
 
 
-def main():
-    """Main function of the script."""
-    parser = argparse.ArgumentParser(description="Load initial data into trademark database")
-    parser.add_argument("--clear", action="store_true", help="Clear existing data before loading")
-    parser.add_argument("--minimal", action="store_true", help="Load only basic sample data")
-    parser.add_argument("--update-existing", action="store_true", help="Update existing records instead of skipping")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    parser.add_argument("--show-sample", action="store_true", help="Show sample data after loading")
+def read_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of a JSON Lines file, one object per line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
 
-    args = parser.parse_args()
-
-    print("🚀 STARTING BULK DATA LOADING")
-    print("=" * 50)
 
+async def run(args: argparse.Namespace):
+    """Run the loading steps selected on the command line."""
     try:
-        with BulkDataLoader(verbose=args.verbose) as loader:
+        async with BulkDataLoader() as loader:
             # Ensure tables exist
-            loader.ensure_tables_exist()
+            await loader.ensure_tables_exist(force=args.create_tables)
 
             # Show initial statistics
-            print("\n📊 INITIAL STATISTICS:")
-            loader.get_current_stats()
+            logger.info("\n📊 INITIAL STATISTICS:")
+            await loader.get_current_stats()
 
             # Clear existing data if requested
             if args.clear:
-                loader.clear_existing_data()
+                await loader.clear_existing_data()
 
             # Prepare data to load
-            data_to_load = SAMPLE_TRADEMARKS.copy()
-            if not args.minimal:
-                data_to_load.extend(ADDITIONAL_TEST_DATA)
+            if args.file:
+                data_to_load = read_jsonl(args.file)
+            else:
+                data_to_load = SAMPLE_TRADEMARKS.copy()
+                if not args.minimal:
+                    data_to_load.extend(ADDITIONAL_TEST_DATA)
 
             # Load data
-            print(f"\n📥 LOADING DATA")
-            print("-" * 30)
-            total_loaded = loader.load_from_list(
+            logger.info(f"\n📥 LOADING DATA")
+            logger.info("-" * 30)
+            total_loaded = await loader.load_from_list(
                 data_to_load,
                 skip_existing=not args.update_existing
             )
 
             # Show final statistics
-            print("\n📊 FINAL STATISTICS:")
-            loader.get_current_stats()
+            logger.info("\n📊 FINAL STATISTICS:")
+            await loader.get_current_stats()
 
             # Show sample data if requested
             if args.show_sample:
-                loader.show_sample_data()
+                await loader.show_sample_data()
+
+            logger.info(f"\n✅ PROCESS COMPLETED")
+            logger.info("=" * 50)
+            logger.info(f"Records processed: {total_loaded}")
+    finally:
+        # Close the pooled connections before the event loop shuts down
+        await get_engine().dispose()
+
+
+def main():
+    """Main function of the script."""
+    parser = argparse.ArgumentParser(description="Load initial data into trademark database")
+    parser.add_argument("--create-tables", action="store_true", help="Create missing tables outside development")
+    parser.add_argument("--clear", action="store_true", help="Clear existing data before loading")
+    parser.add_argument("--file", type=Path, help="Load records from a JSON Lines file instead of the sample data")
+    parser.add_argument("--minimal", action="store_true", help="Load only basic sample data")
+    parser.add_argument("--update-existing", action="store_true", help="Update existing records instead of skipping")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Only report warnings and errors")
+    parser.add_argument("--show-sample", action="store_true", help="Show sample data after loading")
 
-            print(f"\n✅ PROCESS COMPLETED")
-            print("=" * 50)
-            print(f"Records processed: {total_loaded}")
+    args = parser.parse_args()
+
+    # Route all output through logging so a run can be made more or less chatty
+    # (third-party loggers such as SQLAlchemy's stay at WARNING)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stdout)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO)
+
+    logger.info("🚀 STARTING BULK DATA LOADING")
+    logger.info("=" * 50)
+
+    try:
+        asyncio.run(run(args))
 
     except Exception as e:
-        print(f"\n❌ PROCESS FAILED: {e}")
-        if args.verbose:
-            import traceback
-            print(traceback.format_exc())
+        logger.error(f"\n❌ PROCESS FAILED: {e}", exc_info=args.verbose)
         sys.exit(1)
 
 
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List, Any
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Any, Literal, Optional
 from src.db.session import get_db
-from src.db.base import Trademark
 from src.crud import crud_trademark
 from src.api.v1.schemas import trademarks as trademark_schemas
 
@@ -14,9 +14,9 @@ router = APIRouter()
 
 
 @router.post("", response_model=trademark_schemas.TrademarkResponse, status_code=status.HTTP_201_CREATED)
-def create_trademark(
+async def create_trademark(
         trademark: trademark_schemas.TrademarkCreate,  # Request body containing trademark data
-        db: Session = Depends(get_db)  # Database session injected as dependency
+        db: AsyncSession = Depends(get_db)  # Database session injected as dependency
 ):
     """
     Create a new trademark in the database.
@@ -26,7 +26,14 @@ def create_trademark(
     """
     try:
         # Delegate the creation to our CRUD function
-        return crud_trademark.create_trademark(db=db, trademark=trademark)
+        return await crud_trademark.create_trademark(db=db, trademark=trademark)
+    except IntegrityError:
+        # The name is unique, so a duplicate violates the database constraint
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Trademark with name '{trademark.name}' already exists"
+        )
     except Exception as e:
         # Generic catch for unexpected errors during creation
         raise HTTPException(
@@ -36,30 +43,33 @@ def create_trademark(
 
 
 @router.get("", response_model=trademark_schemas.TrademarkListResponse)
-def read_trademarks(
+async def read_trademarks(
         skip: int = 0,
         limit: int = 10,
-        db: Session = Depends(get_db)
+        after_id: Optional[int] = None,  # Query parameter - last ID of the previous page
+        db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     Retrieve a paginated list of all trademarks.
     This endpoint now returns an object containing the list of trademarks
     for the current page and the total number of records in the database.
-    """
-    # Get the list of brands for the current page using the existing CRUD function.
-    trademarks = crud_trademark.get_trademarks(db, skip=skip, limit=limit)
 
-    # Obtain the total number of brands using the existing CRUD function.
-    total = crud_trademark.get_trademarks_count(db)
+    Trademarks are ordered by ID. To walk through large tables, pass the ID
+    of the last trademark received as ?after_id= instead of a growing skip;
+    the page is then read directly from the primary key index.
+    """
+    # Get the brands for the current page and the total number of brands
+    # with a single query.
+    trademarks, total = await crud_trademark.get_trademarks_page(db, skip=skip, limit=limit, after_id=after_id)
 
     # Returns a dictionary that matches the structure of our new "TrademarkListResponse" schema.
     return {"data": trademarks, "total": total}
 
 
 @router.get("/{trademark_id}", response_model=trademark_schemas.TrademarkResponse)
-def read_trademark(
+async def read_trademark(
         trademark_id: int,  # Path parameter - ID of trademark to retrieve
-        db: Session = Depends(get_db)  # Database session dependency
+        db: AsyncSession = Depends(get_db)  # Database session dependency
 ):
     """
     Retrieve a specific trademark by its unique ID.
@@ -68,7 +78,7 @@ def read_trademark(
     If the trademark doesn't exist, it returns a 404 error.
     """
     # Attempt to retrieve the trademark by ID
-    db_trademark = crud_trademark.get_trademark(db, trademark_id=trademark_id)
+    db_trademark = await crud_trademark.get_trademark(db, trademark_id=trademark_id)
 
     # If trademark doesn't exist, return 404 error
     if db_trademark is None:
@@ -81,10 +91,10 @@ def read_trademark(
 
 
 @router.put("/{trademark_id}", response_model=trademark_schemas.TrademarkResponse)
-def update_trademark(
+async def update_trademark(
         trademark_id: int,  # Path parameter - ID of trademark to update
         trademark_update: trademark_schemas.TrademarkUpdate,  # Request body with update data
-        db: Session = Depends(get_db)  # Database session dependency
+        db: AsyncSession = Depends(get_db)  # Database session dependency
 ):
     """
     Update an existing trademark by its ID.
@@ -93,7 +103,15 @@ def update_trademark(
     the fields they want to change. Other fields remain unchanged.
     """
     # Attempt to update the trademark using CRUD function
-    db_trademark = crud_trademark.update_trademark(db, trademark_id=trademark_id, trademark_update=trademark_update)
+    try:
+        db_trademark = await crud_trademark.update_trademark(db, trademark_id=trademark_id, trademark_update=trademark_update)
+    except IntegrityError:
+        # Renaming to a name that is already taken violates the unique constraint
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Trademark with name '{trademark_update.name}' already exists"
+        )
 
     # If trademark doesn't exist, return 404 error
     if db_trademark is None:
@@ -106,9 +124,9 @@ def update_trademark(
 
 
 @router.delete("/{trademark_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_trademark(
+async def delete_trademark(
         trademark_id: int,  # Path parameter - ID of trademark to delete
-        db: Session = Depends(get_db)  # Database session dependency
+        db: AsyncSession = Depends(get_db)  # Database session dependency
 ):
     """
     Delete a trademark by its ID.
@@ -117,7 +135,7 @@ def delete_trademark(
     It returns HTTP 204 No Content on successful deletion.
     """
     # Attempt to delete the trademark using CRUD function
-    success = crud_trademark.delete_trademark(db, trademark_id=trademark_id)
+    success = await crud_trademark.delete_trademark(db, trademark_id=trademark_id)
 
     # If trademark doesn't exist, return 404 error
     if not success:
@@ -132,15 +150,18 @@ def delete_trademark(
 
 
 @router.get("/search/{name}", response_model=List[trademark_schemas.TrademarkResponse])
-def search_trademarks(
+async def search_trademarks(
         name: str,  # Path parameter - search term
-        db: Session = Depends(get_db)  # Database session dependency
+        mode: Literal["prefix", "contains"] = "contains",  # Query parameter - match type
+        db: AsyncSession = Depends(get_db)  # Database session dependency
 ):
     """
     Search trademarks by name using partial, case-insensitive matching.
 
     This endpoint allows users to find trademarks by typing part of the name.
     The search is case-insensitive and matches any trademark containing the search term.
+    With ?mode=prefix it only matches names starting with the term, which is
+    faster on large tables (e.g. for autocomplete).
     """
     # Validate minimum search term length to prevent overly broad searches
     if len(name.strip()) < 2:
@@ -151,22 +172,23 @@ def search_trademarks(
 
     # Perform the search using CRUD function
     # Strip whitespace to clean the search term
-    trademarks = crud_trademark.search_trademarks_by_name(db, name=name.strip())
+    trademarks = await crud_trademark.search_trademarks_by_name(db, name=name.strip(), mode=mode)
     return trademarks
 
 
 @router.get("/filter/status/{status}", response_model=List[trademark_schemas.TrademarkResponse])
-def filter_trademarks_by_status(
+async def filter_trademarks_by_status(
         status: str,  # Path parameter - status to filter by
-        db: Session = Depends(get_db)  # Database session dependency
+        db: AsyncSession = Depends(get_db)  # Database session dependency
 ):
     """
-    Filter trademarks by status using partial, case-insensitive matching.
+    Filter trademarks by status using case-insensitive matching.
 
     This endpoint allows filtering trademarks based on their status field.
-    The filtering is case-insensitive and matches any status containing the term.
+    A known status (Active, Inactive, Pending, Expired) is matched exactly,
+    so "active" no longer matches "Inactive"; any other term matches every
+    status containing it. Results are ordered by name.
     """
-    # Direct database query for simple filtering
-    # Using ilike for case-insensitive partial matching
-    trademarks = db.query(Trademark).filter(Trademark.status.ilike(f"%{status}%")).all()
+    # Delegate the filtering to our CRUD function
+    trademarks = await crud_trademark.filter_trademarks_by_status(db, status=status)
     return trademarks
\ No newline at end of file
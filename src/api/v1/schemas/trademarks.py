@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
 
@@ -99,16 +99,11 @@ class TrademarkResponse(TrademarkBase):
     # This field is automatically populated when we retrieve data from the database
     id: int
 
-    class Config:
-        """
-        Pydantic configuration for the response schema.
-
-        This configuration tells Pydantic how to work with SQLAlchemy model objects.
-        """
-        # Enable ORM mode to work with SQLAlchemy objects
-        # This allows Pydantic to automatically convert SQLAlchemy model instances
-        # to JSON-serializable dictionaries for API responses
-        from_attributes = True
+    # Pydantic configuration for the response schema
+    # Enable ORM mode to work with SQLAlchemy objects
+    # This allows Pydantic to read the attributes of SQLAlchemy model instances
+    # directly when building API responses
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrademarkListResponse(BaseModel):
@@ -1,6 +1,9 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from pydantic_settings import BaseSettings
+from typing import Annotated
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode
 
 # The base directory is the root of the backend project.
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -16,12 +19,29 @@ class Settings(BaseSettings):
     # We can detect the environment based on the presence of the RENDER variable.
     ENVIRONMENT: str = "production" if os.getenv("RENDER") else "development"
 
+    # Frontend origins allowed to call the API (CORS).
+    # Can be overridden with a comma-separated list, e.g.
+    # ALLOWED_ORIGINS="https://example.com,http://localhost:3000"
+    ALLOWED_ORIGINS: Annotated[tuple[str, ...], NoDecode] = (
+        "https://signa-frontend-chi.vercel.app",  # Production frontend
+        "http://localhost:3000",                  # Local frontend development
+        "http://localhost:8000",                  # Local backend for development
+    )
+
     class Config:
         # Load a .env file if it exists (for local development).
         env_file = BASE_DIR / ".env"
         # Make sure environment variable names are matched case-sensitively.
         case_sensitive = True
 
+    @field_validator("ALLOWED_ORIGINS", mode="before")
+    @classmethod
+    def split_allowed_origins(cls, value):
+        """Accept the origins as a comma-separated string."""
+        if isinstance(value, str):
+            return tuple(origin.strip() for origin in value.split(",") if origin.strip())
+        return value
+
     @property
     def is_sqlite(self) -> bool:
         """Check if using SQLite database."""
@@ -32,13 +52,28 @@ class Settings(BaseSettings):
         """Check if using PostgreSQL or Postgres database."""
         return self.DATABASE_URL.startswith("postgresql") or self.DATABASE_URL.startswith("postgres")
 
+    @property
+    def async_database_url(self) -> str:
+        """Database URL using the asyncio driver (aiosqlite or asyncpg)."""
+        scheme, rest = self.DATABASE_URL.split("://", 1)
+        if self.is_sqlite:
+            return f"sqlite+aiosqlite://{rest}"
+        if self.is_postgres:
+            return f"postgresql+asyncpg://{rest}"
+        return self.DATABASE_URL
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, reading the environment only once."""
+    return Settings()
 
-# Create a single, global instance of the settings.
-settings = Settings()
 
-# A print statement to help debug which environment is being used.
-print(f"--- SETTINGS LOADED ---")
-print(f"Environment: {settings.ENVIRONMENT}")
-print(f"Database Type: {'PostgreSQL' if settings.is_postgres else 'SQLite'}")
-print(f"Database URL Hint: {settings.DATABASE_URL[:30]}...")
-print(f"-----------------------")
\ No newline at end of file
+if __name__ == "__main__":
+    # Print the resolved settings to help debug which environment is being used.
+    settings = get_settings()
+    print(f"--- SETTINGS LOADED ---")
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print(f"Database Type: {'PostgreSQL' if settings.is_postgres else 'SQLite'}")
+    print(f"Database URL Hint: {settings.DATABASE_URL[:30]}...")
+    print(f"-----------------------")
@@ -1,6 +1,8 @@
-from typing import Optional, TYPE_CHECKING
-from sqlalchemy.orm import Session
-from src.db.base import Trademark
+from typing import Any, AsyncIterator, Literal, Optional, TYPE_CHECKING
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.db.base import TRADEMARK_STATUSES, Trademark
 from src.api.v1.schemas.trademarks import TrademarkCreate, TrademarkUpdate
 
 # TYPE_CHECKING is used to avoid circular imports while still providing type hints
@@ -9,32 +11,47 @@ if TYPE_CHECKING:
     pass
 
 
-def get_trademark(db: Session, trademark_id: int) -> Optional[Trademark]:
+async def get_trademark(db: AsyncSession, trademark_id: int) -> Optional[Trademark]:
     """
     Retrieves a single trademark by its unique ID.
 
     This function queries the database for a trademark with the specified ID.
     """
-    # Query the Trademark table, filter by ID, and return the first match
-    # .first() returns None if no match is found
-    return db.query(Trademark).filter(Trademark.id == trademark_id).first()
+    # Look up the trademark by primary key
+    # .get() returns an object already loaded in this session without a query,
+    # and None if no match is found
+    return await db.get(Trademark, trademark_id)
 
 
-def get_trademarks(db: Session, skip: int = 0, limit: int = 100) -> list[Trademark]:
+async def get_trademarks(db: AsyncSession, skip: int = 0, limit: int = 100) -> list[Trademark]:
     """
     Retrieves a paginated list of trademarks from the database.
 
     This function implements pagination to handle large datasets efficiently.
     It skips a specified number of records and limits the results returned.
     """
-    # Query all trademarks, apply pagination, and return as list
+    # Select all trademarks, apply pagination, and return as list
     # .offset() skips the specified number of records
     # .limit() restricts the number of results returned
-    # .all() executes the query and returns all matching records
-    return db.query(Trademark).offset(skip).limit(limit).all()
+    # .scalars() returns the Trademark objects of every row
+    result = await db.scalars(select(Trademark).offset(skip).limit(limit))
+    return list(result.all())
 
 
-def get_trademarks_count(db: Session) -> int:
+async def iter_trademarks(db: AsyncSession, limit: Optional[int] = None, chunk_size: int = 1000) -> AsyncIterator[Trademark]:
+    """
+    Iterates over trademarks without loading the whole result into memory.
+
+    Rows are streamed from a server-side cursor and fetched in chunks of
+    chunk_size, so memory use stays bounded regardless of the table size.
+    """
+    stmt = select(Trademark).order_by(Trademark.id).limit(limit)
+    result = await db.stream_scalars(stmt.execution_options(yield_per=chunk_size))
+    async for trademark in result:
+        yield trademark
+
+
+async def get_trademarks_count(db: AsyncSession) -> int:
     """
     Counts the total number of trademarks in the database.
 
@@ -42,11 +59,58 @@ def get_trademarks_count(db: Session) -> int:
     total counts in user interfaces.
     """
     # Count all records in the Trademark table
-    # .count() returns the number of records matching the query
-    return db.query(Trademark).count()
+    # SELECT count(*) returns the number of records in the table
+    return await db.scalar(select(func.count()).select_from(Trademark))
+
+
+async def get_trademarks_page(
+        db: AsyncSession, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+) -> tuple[list[Trademark], int]:
+    """
+    Retrieves a page of trademarks together with the total number of trademarks.
+
+    The total is computed in the same query as the page, so the page and the
+    count come back from the database together. Trademarks are ordered by ID.
 
+    When after_id is given, the page starts right after that ID (keyset
+    pagination) and skip is ignored: the primary key index jumps straight to
+    the first row instead of reading and discarding skip rows, so the last
+    page costs the same as the first.
+    """
+    stmt = select(Trademark).order_by(Trademark.id).limit(limit)
+
+    if after_id is None:
+        # Every row carries the total count of the table in its "total" column
+        stmt = stmt.add_columns(func.count().over().label("total")).offset(skip)
+    else:
+        # The window count would only cover rows after after_id, so count the
+        # whole table in a scalar subquery instead
+        total_count = select(func.count()).select_from(Trademark).scalar_subquery()
+        stmt = stmt.add_columns(total_count.label("total")).where(Trademark.id > after_id)
+
+    rows = (await db.execute(stmt)).all()
+
+    # Past the last page (or with limit=0) there is no row to read the total
+    # from; only an unrestricted first page proves the table is empty
+    if not rows:
+        total = await get_trademarks_count(db) if skip or after_id is not None or limit <= 0 else 0
+        return [], total
+
+    return [row[0] for row in rows], rows[0].total
 
-def create_trademark(db: Session, trademark: TrademarkCreate) -> Trademark:
+
+async def get_status_histogram(db: AsyncSession) -> dict[str, int]:
+    """
+    Counts the trademarks of each status.
+
+    A single GROUP BY query returns the count of every status present
+    in the database, e.g. {"Active": 15, "Pending": 1}.
+    """
+    result = await db.execute(select(Trademark.status, func.count()).group_by(Trademark.status))
+    return dict(result.all())
+
+
+async def create_trademark(db: AsyncSession, trademark: TrademarkCreate) -> Trademark:
     """
     Creates a new trademark record in the database.
 
@@ -67,17 +131,15 @@ def create_trademark(db: Session, trademark: TrademarkCreate) -> Trademark:
     db.add(db_trademark)
 
     # Commit the transaction to save the changes to the database
-    # This is when the actual INSERT statement is executed
-    db.commit()
-
-    # Refresh the object to get the auto-generated ID from the database
-    # This ensures our object has the same data as what's stored in the DB
-    db.refresh(db_trademark)
+    # This is when the actual INSERT statement is executed; the auto-generated
+    # ID is populated from the INSERT itself, so no refresh query is needed
+    # (the session is configured with expire_on_commit=False)
+    await db.commit()
 
     return db_trademark
 
 
-def update_trademark(db: Session, trademark_id: int, trademark_update: TrademarkUpdate) -> Trademark | None:
+async def update_trademark(db: AsyncSession, trademark_id: int, trademark_update: TrademarkUpdate) -> Trademark | None:
     """
     Updates an existing trademark record in the database.
 
@@ -85,7 +147,7 @@ def update_trademark(db: Session, trademark_id: int, trademark_update: Trademark
     in the update schema will be modified. Other fields remain unchanged.
     """
     # First, find the existing trademark in the database
-    db_trademark = db.query(Trademark).filter(Trademark.id == trademark_id).first()
+    db_trademark = await get_trademark(db, trademark_id)
 
     # If trademark doesn't exist, return None to indicate failure
     if not db_trademark:
@@ -102,50 +164,123 @@ def update_trademark(db: Session, trademark_id: int, trademark_update: Trademark
         setattr(db_trademark, field, value)
 
     # Commit the changes to the database
-    db.commit()
+    await db.commit()
 
     # Refresh to ensure our object matches the database state
-    db.refresh(db_trademark)
+    await db.refresh(db_trademark)
 
     return db_trademark
 
 
-def delete_trademark(db: Session, trademark_id: int) -> bool:
+async def delete_trademark(db: AsyncSession, trademark_id: int) -> bool:
     """
     Deletes a trademark record from the database.
 
-    This function finds the trademark by ID and removes it from the database.
-    It returns a boolean indicating whether the operation was successful.
+    This function removes the trademark with the given ID using a single
+    DELETE statement, without loading it first. It returns a boolean
+    indicating whether a trademark was actually deleted.
     """
-    # Find the trademark to delete
-    db_trademark = db.query(Trademark).filter(Trademark.id == trademark_id).first()
-
-    # If trademark doesn't exist, return False
-    if not db_trademark:
-        return False
-
-    # Delete the object from the database session
-    db.delete(db_trademark)
+    # Issue the DELETE directly; there is no loaded object to keep in sync
+    stmt = delete(Trademark).where(Trademark.id == trademark_id)
+    result = await db.execute(stmt.execution_options(synchronize_session=False))
 
     # Commit the deletion to the database
-    # This is when the actual DELETE statement is executed
-    db.commit()
+    await db.commit()
 
-    # Return True to indicate successful deletion
-    return True
+    # rowcount is 0 when no trademark had this ID
+    return result.rowcount > 0
 
 
-def search_trademarks_by_name(db: Session, name: str) -> list[Trademark]:
+async def search_trademarks_by_name(
+        db: AsyncSession,
+        name: str,
+        mode: Literal["prefix", "contains"] = "contains"
+) -> list[Trademark]:
     """
-    Searches for trademarks by name using partial, case-insensitive matching.
+    Searches for trademarks by name using case-insensitive matching.
 
     This function allows users to find trademarks by typing part of the name.
     The search is case-insensitive, so "nike", "Nike", and "NIKE" will all
-    find trademarks containing those letters.
-    """
-    # Use ilike for case-insensitive partial matching
-    # The % symbols are wildcards that match any characters
-    # So "%name%" will match any string containing "name" anywhere within it
-    return db.query(Trademark).filter(
-        Trademark.name.ilike(f"%{name}%")  # ilike = case-insensitive LIKE
-    ).all()
\ No newline at end of file
+    find trademarks containing those letters. In "prefix" mode only names
+    starting with the term match, which the ix_trademarks_name_lower index
+    can serve (e.g. for autocomplete).
+    """
+    if mode == "prefix":
+        # lower(name) LIKE 'term%' is an index range scan on lower(name)
+        # LIKE wildcards in the term are escaped so they match literally
+        # The term is lowercased by the database too, so both sides fold case
+        # the same way (SQLite's lower() only folds ASCII letters)
+        pattern = name.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        condition = func.lower(Trademark.name).like(func.lower(literal(pattern)) + "%", escape="/")
+    else:
+        # Use ilike for case-insensitive partial matching
+        # The % symbols are wildcards that match any characters
+        # So "%name%" will match any string containing "name" anywhere within it
+        condition = Trademark.name.ilike(f"%{name}%")  # ilike = case-insensitive LIKE
+
+    result = await db.scalars(select(Trademark).where(condition))
+    return list(result.all())
+
+
+async def filter_trademarks_by_status(db: AsyncSession, status: str) -> list[Trademark]:
+    """
+    Filters trademarks by status using case-insensitive matching.
+
+    A known status (e.g. "active") is matched exactly against lower(status);
+    the ix_trademarks_status_name index serves both that match and the
+    ordering by name. Any other term falls back to partial matching
+    anywhere within the status.
+    """
+    if status.lower() in (known.lower() for known in TRADEMARK_STATUSES):
+        condition = func.lower(Trademark.status) == status.lower()
+    else:
+        condition = Trademark.status.ilike(f"%{status}%")
+
+    result = await db.scalars(select(Trademark).where(condition).order_by(Trademark.name))
+    return list(result.all())
+
+
+async def bulk_upsert(db: AsyncSession, rows: list[dict[str, Any]], update_existing: bool = False) -> int:
+    """
+    Inserts many trademark records with an INSERT ... ON CONFLICT statement.
+
+    Rows whose name already exists are skipped, or overwritten when
+    update_existing is True. When rows repeats a name, the last of those rows
+    wins when updating and the first one when skipping, as if the rows were
+    written one by one. Returns the number of rows inserted or updated.
+
+    The rows are passed as executemany() parameters, which SQLAlchemy sends
+    as multi-row VALUES batches ("insertmanyvalues"); the statement itself is
+    the same for every batch, so it is compiled once and then cached.
+    """
+    if not rows:
+        return 0
+
+    # A single multi-row INSERT ... ON CONFLICT DO UPDATE cannot touch the same
+    # row twice on PostgreSQL (SQLite silently lets the last one win), so keep
+    # only the last row per name; DO NOTHING already keeps the first one
+    if update_existing:
+        rows = list({row["name"]: row for row in rows}.values())
+
+    # ON CONFLICT is a dialect-specific extension, so build the INSERT
+    # with the construct of the database we are connected to
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(Trademark)
+
+    # The unique index on "name" is the conflict target
+    if update_existing:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "description": stmt.excluded.description,
+                "status": stmt.excluded.status,
+            },
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=["name"])
+
+    # RETURNING only yields the rows that were actually inserted or updated
+    result = await db.execute(stmt.returning(Trademark.id), rows)
+    loaded = len(result.all())
+    await db.commit()
+    return loaded
@@ -1,9 +1,17 @@
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, Text
+from typing import Optional
+from sqlalchemy import DDL, Index, Integer, String, Text, event, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-# Create the base class that all our database models will inherit from
-# This provides common functionality like table mapping and ORM features
-Base = declarative_base()
+# Status values used by the application (e.g. in the loader's sample data)
+TRADEMARK_STATUSES = ("Active", "Inactive", "Pending", "Expired")
+
+
+class Base(DeclarativeBase):
+    """
+    Base class that all our database models will inherit from.
+    This provides common functionality like table mapping and ORM features.
+    """
+    pass
 
 
 class Trademark(Base):
@@ -20,21 +28,25 @@ class Trademark(Base):
     # Primary key column - unique identifier for each trademark
     # autoincrement=True means the database will automatically generate new IDs
     # index=True creates a database index for faster queries on this column
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
 
     # Trademark name - required field with maximum 100 characters
     # nullable=False means this field cannot be empty
     # index=True creates an index since we'll often search by name
-    name = Column(String(100), nullable=False, index=True)
+    # unique=True makes it a unique index, so each name is stored only once
+    # On PostgreSQL, partial-name searches (ILIKE '%term%') are served by the
+    # ix_trademarks_name_trgm trigram index declared below
+    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True, unique=True)
 
     # Trademark description - optional field for longer text
     # Text type allows for longer descriptions than String
     # nullable=True means this field can be empty
-    description = Column(Text, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Trademark status - required field with maximum 50 characters
     # default="Active" sets a default value when no status is provided
-    status = Column(String(50), nullable=False, default="Active")
+    # index=True creates an index since we filter trademarks by status
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="Active", index=True)
 
     def __repr__(self):
         """
@@ -44,4 +56,39 @@ class Trademark(Base):
         Returns:
             String showing the trademark's ID, name, and status
         """
-        return f"<Trademark(id={self.id}, name='{self.name}', status='{self.status}')>"
\ No newline at end of file
+        return f"<Trademark(id={self.id}, name='{self.name}', status='{self.status}')>"
+
+
+# Composite index for listing the trademarks of a status ordered by name
+# (WHERE lower(status) = 'active' ORDER BY name)
+Index("ix_trademarks_status_name", func.lower(Trademark.status), Trademark.name)
+
+# Functional index for case-insensitive prefix searches on name
+# (WHERE lower(name) LIKE 'term%')
+# PostgreSQL only uses it for LIKE when it is built with text_pattern_ops
+# (unless the database uses the C locale), matching the migration
+Index(
+    "ix_trademarks_name_lower",
+    func.lower(Trademark.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+)
+
+# Trigram index so PostgreSQL can serve ILIKE '%term%' name searches without
+# scanning the whole table. It is declared here (not only in the migrations)
+# so tables created from the models get it too and autogenerate doesn't try
+# to drop it. It only exists on PostgreSQL: other databases skip it, and
+# alembic/env.py ignores it when comparing their schema
+Index(
+    "ix_trademarks_name_trgm",
+    Trademark.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+# gin_trgm_ops comes from the pg_trgm extension, which must exist before
+# the table's indexes are created
+event.listen(
+    Trademark.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
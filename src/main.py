@@ -1,39 +1,101 @@
-import sys
-from pathlib import Path
-
-# Configure the Python path to resolve imports
-current_dir = Path(__file__).resolve().parent
-backend_dir = current_dir.parent
-sys.path.insert(0, str(backend_dir))
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from src.api.v1.endpoints import trademarks
+from src.core.config import get_settings
+from src.db.session import get_engine
+
+logger = logging.getLogger(__name__)
+
+# How often a long-running server refreshes SQLite's query planner statistics
+SQLITE_OPTIMIZE_INTERVAL = 3 * 60 * 60  # seconds
+
+
+async def optimize_sqlite():
+    """
+    Run PRAGMA optimize so SQLite refreshes stale query planner statistics.
+    It is a cheap no-op when there is nothing to analyze.
+    """
+    async with get_engine().connect() as conn:
+        await conn.exec_driver_sql("PRAGMA optimize")
+
+
+async def optimize_sqlite_periodically():
+    """Run PRAGMA optimize every SQLITE_OPTIMIZE_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(SQLITE_OPTIMIZE_INTERVAL)
+        try:
+            await optimize_sqlite()
+        except Exception:
+            logger.exception("PRAGMA optimize failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the database engine when the app starts, keep SQLite's planner
+    statistics up to date while it runs, and close the database connections
+    on shutdown.
+    """
+    # Build the engine inside the running worker process (after uvicorn has
+    # forked it), so no connection pool is ever shared between processes and
+    # the first request doesn't pay for creating it
+    engine = get_engine()
+
+    optimize_task = None
+    if get_settings().is_sqlite:
+        optimize_task = asyncio.create_task(optimize_sqlite_periodically())
+
+    yield
+
+    try:
+        if optimize_task is not None:
+            optimize_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await optimize_task
+            try:
+                await optimize_sqlite()
+            except Exception:
+                logger.exception("PRAGMA optimize failed")
+    finally:
+        # Close pooled connections (aiosqlite's connection threads would
+        # otherwise keep the process from exiting)
+        await engine.dispose()
 
-# Define the list of allowed origins (domains)
-# This explicitly tells the backend which frontend URLs are allowed to make requests.
-origins = [
-    "https://signa-frontend-chi.vercel.app",  # Your frontend's production URL
-    "http://localhost:3000",                  # The URL for your local frontend development
-    "http://localhost:8000",                  # Local backend for development
-]
 
 # Create the main FastAPI application instance
 # This is the core of our API with metadata for documentation
 app = FastAPI(
     title="Trademark CRUD API",
     description="API for trademark record management - SignaIP Technical Test",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Serialize JSON responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
+# Compress responses larger than 500 bytes (e.g. trademark lists with
+# descriptions) for clients that send Accept-Encoding: gzip
+# Added before CORS so the CORS middleware stays the outermost layer
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Configure CORS (Cross-Origin Resource Sharing) middleware
 # This allows our API to be accessed from different domains/origins
+# The allowed frontend URLs come from the ALLOWED_ORIGINS setting
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=get_settings().ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    # Let browsers cache preflight responses for a day instead of sending
+    # an OPTIONS request before every cross-origin call
+    max_age=86400,
 )
 
 # Include the trademark router with all its endpoints
@@ -42,12 +104,16 @@ app.add_middleware(
 # Tags group the endpoints in the API documentation
 app.include_router(trademarks.router, prefix="/api/v1/trademarks", tags=["Trademarks"])
 
+# The welcome message never changes, so its JSON body is encoded only once
+ROOT_RESPONSE_BODY = b'{"message":"Welcome to SignaIP API"}'
+
+
 # Root endpoint - simple health check or welcome message
 # This will be accessible at GET /
 @app.get("/")
-def read_root():
+async def read_root():
     """
     Root endpoint that returns a welcome message.
     Useful for health checks and API status verification.
     """
-    return {"message": "Welcome to SignaIP API"}
\ No newline at end of file
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
\ No newline at end of file